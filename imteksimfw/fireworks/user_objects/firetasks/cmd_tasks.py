@@ -27,8 +27,10 @@
 import logging
 import io
 import multiprocessing
+import multiprocessing.connection
 import os
 import pickle
+import signal
 import subprocess
 import sys
 import traceback
@@ -94,7 +96,7 @@ class NonBlockingStreamReader:
             '''
             for line in iter(stream.readline, b''):
                 if line is not None and len(line) > 0:
-                    self.logger.debug("Queueing line '{}'.".format(line))
+                    self.logger.debug("Queueing line '%s'.", line)
                 queue.put(line)
 
         self._t = threading.Thread(target=_populate_queue,
@@ -107,7 +109,7 @@ class NonBlockingStreamReader:
             line = self._q.get(block=timeout is not None,
                 timeout=timeout)
             if line is not None and len(line) > 0:
-                self.logger.debug("Popped line '{}'.".format(line))
+                self.logger.debug("Popped line '%s'.", line)
             return line
         except Empty:
             self.logger.debug("Nothing popped.")
@@ -141,8 +143,7 @@ class Tee(threading.Thread):
                 # thread is about to stop, try to get remaining contents in stream
                 # try to flush instream (if it's both readable AND writable)
                 self.logger.debug(
-                    "{} received stop signal, reading remaining stream data."
-                        .format(self.name))
+                    "%s received stop signal, reading remaining stream data.", self.name)
                 try:
                     instream.flush()
                 except Exception:
@@ -159,13 +160,13 @@ class Tee(threading.Thread):
         for f in self.outstreams:
             f.flush()
         if hasattr(self, 'name'):
-            self.logger.debug("{} received stop signal and finished.".format(self.name))
+            self.logger.debug("%s received stop signal and finished.", self.name)
 
     def join(self, timeout=None):
         """ Stop the thread. """
         self._stopevent.set()
         if hasattr(self, 'name'):
-            self.logger.debug("Ending thread '{}'".format(self.name))
+            self.logger.debug("Ending thread '%s'", self.name)
         threading.Thread.join(self, timeout)
 
 
@@ -180,13 +181,13 @@ class TeeContext():
 
     def __enter__(self):
         if 'name' in self.kwargs:
-            self.logger.debug("Entering '{}' context.".format(self.kwargs['name']))
+            self.logger.debug("Entering '%s' context.", self.kwargs['name'])
         self.tee = Tee(self.instream, *self.outstreams, **self.kwargs)
         self.tee.start()
 
     def __exit__(self, et, ev, tb):
         if 'name' in self.kwargs:
-            self.logger.debug("Leaving '{}' context.".format(self.kwargs['name']))
+            self.logger.debug("Leaving '%s' context.", self.kwargs['name'])
         # self.tee.join(0.0)
         self.tee.join()
 
@@ -200,8 +201,7 @@ class PipeRWPair(io.BufferedRWPair):
         self._pipeout, self._pipein = os.pipe()
         if self.instance_name is not None:
             self.logger.debug(
-                "{:s} opened pipe with infile {:d} and outfile {:d}."
-                    .format(self.instance_name, self._pipein, self._pipeout))
+                "%s opened pipe with infile %d and outfile %d.", self.instance_name, self._pipein, self._pipeout)
 
         self.pipe_reader = io.FileIO(self._pipeout, mode='rb')
         self.pipe_writer = io.FileIO(self._pipein, mode='wb')
@@ -222,7 +222,7 @@ class TextIOPipeContext(TextIOPipe):
     """Flushed underlying pipe writer when leaving context."""
     def __exit__(self, et, ev, tb):
         if self.instance_name is not None:
-            self.logger.debug("Flushing {:s}.".format(self.instance_name))
+            self.logger.debug("Flushing %s.", self.instance_name)
         self.flush()
 
 
@@ -419,25 +419,36 @@ class EnvTask(FiretaskBase):
             p = Process(target=self._run_task, args=(q, fw_spec,))
             p.start()
 
-            # wait for child to queue fw_action object and
-            # check whether child raises exception
-            while q.empty():
-                # if child raises exception, then it has terminated
-                # before queueing any fw_action object
-                if p.exception:
-                    error, p_traceback = p.exception
-                    raise ChildProcessError(p_traceback)
-            # this loop will deadlock for any child that never raises
-            # an exception and does not queue anything
+            # block on the queue's pipe, the child's exception pipe and
+            # the process sentinel instead of busy-polling the queue;
+            # one of them becomes readable as soon as the child has
+            # queued its fw_action, raised or died
+            multiprocessing.connection.wait(
+                [q._reader, p._parent_conn, p.sentinel])
+
+            # if child raises exception, then it has terminated
+            # before queueing any fw_action object
+            if p.exception:
+                error, p_traceback = p.exception
+                raise ChildProcessError(p_traceback)
 
             # child has finished without exception
             # child must always return fw_action
             # queue only used for one transfer of
             # return fw_action, should thus never deadlock.
             fw_action = q.get()
-            # if we reach this line without the child
-            # queueing anything, then process will deadlock.
-            p.join()
+            # the result has been delivered at this point: don't hang
+            # forever on a lingering child (i.e. a stuck non-daemon Tee
+            # thread), escalate from plain join via SIGTERM to SIGKILL
+            # with bounded waits so the child is really gone when this
+            # method returns
+            p.join(5)
+            if p.is_alive():
+                p.terminate()
+                p.join(5)
+            if p.is_alive():
+                os.kill(p.pid, signal.SIGKILL)
+                p.join()
         else:
             fw_action = self._run_task(None, fw_spec)
 
@@ -470,7 +481,10 @@ class EnvTask(FiretaskBase):
             # create non-default streams to insert into db if desired
             out_streams = []
             if self.stdout_file:
-                outf = open(self.stdout_file, 'a', **ENCODING_PARAMS)
+                # line buffering: one write per line reaches the file
+                # promptly, so a crash loses at most the current line
+                outf = open(self.stdout_file, 'a', buffering=1,
+                            **ENCODING_PARAMS)
                 out_streams.append(outf)
             if self.store_stdout:
                 stdout_stream = io.StringIO()  # io.TextIOWrapper(io.BytesIO(), **ENCODING_PARAMS)
@@ -491,7 +505,8 @@ class EnvTask(FiretaskBase):
 
             err_streams = []
             if self.stderr_file:
-                errf = open(self.stderr_file, 'a', **ENCODING_PARAMS)
+                errf = open(self.stderr_file, 'a', buffering=1,
+                            **ENCODING_PARAMS)
                 err_streams.append(errf)
             if self.store_stderr:
                 stderr_stream = io.StringIO()
@@ -798,8 +813,7 @@ class CmdTask(EnvTask, ScriptTask):
         # in case of a specified worker environment
         if self.env and "_fw_env" in fw_spec \
                 and self.env in fw_spec["_fw_env"]:
-            self.logger.info("Found {:s}-specific block '{}' within worker file."
-                .format(self.env, fw_spec["_fw_env"]))
+            self.logger.info("Found %s-specific block '%s' within worker file.", self.env, fw_spec["_fw_env"])
 
             # """Parse global init block."""
             # _fw_env : env : init may provide a list of python commans
@@ -810,7 +824,7 @@ class CmdTask(EnvTask, ScriptTask):
                     init = [init]
                 assert isinstance(init, list)
                 for cmd in init:
-                    self.logger.info("Execute '{:s}'.".format(cmd))
+                    self.logger.info("Execute '%s'.", cmd)
                     self._py_hist_append(cmd)
                     exec(cmd)
 
@@ -827,8 +841,7 @@ class CmdTask(EnvTask, ScriptTask):
 
                 # so far, only simple overrides, no pre- or appending
                 for i, (key, value) in enumerate(env_dict.items()):
-                    self.logger.info("Set env var '{:s}' = '{:s}'.".format(
-                        key, value))
+                    self.logger.info("Set env var '%s' = '%s'.", key, value)
                     self._py_hist_append('os.environ["{:s}"] = "{:s}"'.format(
                         str(key), str(value)))
                     os.environ[str(key)] = str(value)
@@ -840,8 +853,9 @@ class CmdTask(EnvTask, ScriptTask):
             """Parse command-specific environment block."""
             if "cmd" in fw_spec["_fw_env"][self.env] \
                     and self.cmd in fw_spec["_fw_env"][self.env]["cmd"]:
-                self.logger.info("Found {:s}-specific block '{}' within worker file."
-                    .format(self.cmd, fw_spec["_fw_env"][self.env]["cmd"][self.cmd]))
+                self.logger.info(
+                    "Found %s-specific block '%s' within worker file.",
+                    self.cmd, fw_spec["_fw_env"][self.env]["cmd"][self.cmd])
                 # same as above, evaluate command-specific initialization code
                 """Parse per-command init block."""
                 cmd_block = fw_spec["_fw_env"][self.env]["cmd"][self.cmd]
@@ -851,7 +865,7 @@ class CmdTask(EnvTask, ScriptTask):
                         init = [init]
                     assert isinstance(init, list), "'init' must be str or list"
                     for cmd in init:
-                        self.logger.info("Execute '{:s}'.".format(cmd))
+                        self.logger.info("Execute '%s'.", cmd)
                         self._py_hist_append(cmd)
                         exec(cmd)
 
@@ -860,12 +874,10 @@ class CmdTask(EnvTask, ScriptTask):
                 if "substitute" in cmd_block:
                     substitute = cmd_block["substitute"]
                     assert isinstance(substitute, str), "substitute must be str"
-                    self.logger.info("Substitute '{:s}' with '{:s}'.".format(
-                        self.cmd, substitute))
+                    self.logger.info("Substitute '%s' with '%s'.", self.cmd, substitute)
                     self._args.append(substitute)
                 else:  # otherwise just use command as specified
-                    self.logger.info("No substitute for command '{:s}'.".format(
-                        self.cmd))
+                    self.logger.info("No substitute for command '%s'.", self.cmd)
                     self._args.append(self.cmd)
 
                 """Parse per-command prefix block."""
@@ -887,8 +899,7 @@ class CmdTask(EnvTask, ScriptTask):
                         if isinstance(prefix, dict):
                             # special treatment desired for this prefix
                             if "eval" in prefix:
-                                self.logger.info("Evaluate prefix '{:s}'.".format(
-                                    ' '.join(prefix["eval"])))
+                                self.logger.info("Evaluate prefix '%s'.", ' '.join(prefix["eval"]))
                                 # evaluate prefix in current context
                                 processed_prefix = eval(prefix["eval"])
                                 try:
@@ -916,8 +927,7 @@ class CmdTask(EnvTask, ScriptTask):
                         if not isinstance(processed_prefix, list):
                             processed_prefix = [processed_prefix]
 
-                        self.logger.info("Prepend prefix '{:s}'.".format(
-                            ' '.join(processed_prefix)))
+                        self.logger.info("Prepend prefix '%s'.", ' '.join(processed_prefix))
                         processed_prefix_list.extend(processed_prefix)
 
                     self._args = processed_prefix_list + self._args  # concat two lists
@@ -936,8 +946,7 @@ class CmdTask(EnvTask, ScriptTask):
 
                     # so far, only simple overrides, no pre- or appending
                     for i, (key, value) in enumerate(env_dict.items()):
-                        self.logger.info("Set env var '{:s}' = '{:s}'.".format(
-                            key, value))
+                        self.logger.info("Set env var '%s' = '%s'.", key, value)
                         self._py_hist_append('os.environ["{:s}"] = "{:s}"'.format(
                             str(key), str(value)))
                         os.environ[str(key)] = str(value)
@@ -946,8 +955,9 @@ class CmdTask(EnvTask, ScriptTask):
         elif "_fw_env" in fw_spec and self.cmd in fw_spec["_fw_env"]:
             # check whether there is any desired command and whether there
             # exists a machine-specific "alias"
-            self.logger.info("Found root-level {:s}-specific block '{}' within worker file."
-                .format(self.cmd, fw_spec["_fw_env"][self.cmd]))
+            self.logger.info(
+                "Found root-level %s-specific block '%s' within worker file.",
+                self.cmd, fw_spec["_fw_env"][self.cmd])
             self._args = [fw_spec["_fw_env"][self.cmd]]
         else:
             self._args = [self.cmd]
@@ -967,10 +977,9 @@ class CmdTask(EnvTask, ScriptTask):
                 # to be sure, always append string representation
                 self._args.append(str(arg))
 
-        self.logger.info("Built args '{}'.".format(self._args))
-        self.logger.info("Built command '{:s}'.".format(
-            ' '.join(self.args)))
-        self.logger.debug("Process environment '{}'.".format(os.environ))
+        self.logger.info("Built args '%s'.", self._args)
+        self.logger.info("Built command '%s'.", ' '.join(self.args))
+        self.logger.debug("Process environment '%s'.", os.environ)
 
         kwargs = {}
         if self.shell_exe:
@@ -1026,9 +1035,9 @@ class CmdTask(EnvTask, ScriptTask):
         ### DONE WRITING PY_HIST
 
         self.logger.info("Evoking subprocess.Popen with...")
-        self.logger.info("    args            '{}'.".format(self.args))
-        self.logger.info("    ENCODING_PARAMS '{}'.".format(ENCODING_PARAMS))
-        self.logger.info("    kwargs          '{}'.".format(kwargs))
+        self.logger.info("    args            '%s'.", self.args)
+        self.logger.info("    ENCODING_PARAMS '%s'.", ENCODING_PARAMS)
+        self.logger.info("    kwargs          '%s'.", kwargs)
 
         p = subprocess.Popen(
             self.args, stdin=stdin,
@@ -1036,38 +1045,51 @@ class CmdTask(EnvTask, ScriptTask):
             **ENCODING_PARAMS, **kwargs)
 
         self.logger.info("Evoked process with...")
-        self.logger.info("    args         '{}'.".format(p.args))
-        self.logger.info("    PID          '{}'.".format(p.pid))
-        self.logger.info("    type(stdin)  '{}'.".format(type(p.stdin)))
-        self.logger.info("    type(stdout) '{}'.".format(type(p.stdout)))
-        self.logger.info("    type(stderr) '{}'.".format(type(p.stderr)))
+        self.logger.info("    args         '%s'.", p.args)
+        self.logger.info("    PID          '%s'.", p.pid)
+        self.logger.info("    type(stdin)  '%s'.", type(p.stdin))
+        self.logger.info("    type(stdout) '%s'.", type(p.stdout))
+        self.logger.info("    type(stderr) '%s'.", type(p.stderr))
 
         threads = []
 
-        out_streams = []
-        out_streams.append(sys.stdout)  # per default to sys.stdout
-        threads.append(tee(p.stdout, *out_streams))
-
-        err_streams = []
-        err_streams.append(sys.stderr)  # per default to sys.stderr
-        threads.append(tee(p.stderr, *err_streams))
-
-        # send stdin if desired and wait for subprocess to complete
-        if self.stdin_key:
-            p.stdin.writelines(stdin_list)
-
         try:
-            p.stdin.close()
-        except:
-            pass
+            out_streams = []
+            out_streams.append(sys.stdout)  # per default to sys.stdout
+            threads.append(tee(p.stdout, *out_streams))
 
-        for thread in threads:
-            thread.join()  # wait for stream tee threads
-        # tee threads close stderr and stdout
+            err_streams = []
+            err_streams.append(sys.stderr)  # per default to sys.stderr
+            threads.append(tee(p.stderr, *err_streams))
+
+            # send stdin if desired and wait for subprocess to complete
+            if self.stdin_key:
+                p.stdin.writelines(stdin_list)
 
-        returncode = p.wait()
+            try:
+                p.stdin.close()
+            except:
+                pass
+
+            for thread in threads:
+                thread.join()  # wait for stream tee threads
+            # tee threads close stderr and stdout
+
+            returncode = p.wait()
+        except Exception:
+            # terminate the spawned child explicitly instead of leaving
+            # it orphaned when the surrounding task machinery fails,
+            # escalating to SIGKILL if it ignores the SIGTERM
+            if p.poll() is None:
+                p.terminate()
+                try:
+                    p.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    p.kill()
+                    p.wait()
+            raise
         self.logger.info(
-            "Process returned '{}'.".format(returncode))
+            "Process returned '%s'.", returncode)
 
         output = {}
 
@@ -1250,16 +1272,14 @@ class PyEnvTask(EnvTask, PyTask):
             self._py_hist_append('from {} import {} as func'
                 .format(modname, funcname))
             self.logger.info(
-                "'func' is a fully qualified name, 'from {} import {}'"
-                    .format(modname, funcname))
+                "'func' is a fully qualified name, 'from %s import %s'", modname, funcname)
             mod = __import__(modname, globals(), locals(), [str(funcname)], 0)
             func = getattr(mod, funcname)
         else:
             # Handle built in functions.
             self._py_hist_append('func = {}'.format(toks[0]))
             self.logger.info(
-                "'func' is an unqualified name '{}', call directly."
-                    .format(toks[0]))
+                "'func' is an unqualified name '%s', call directly.", toks[0])
             func = getattr(builtins, toks[0])
         return func
 
@@ -1268,8 +1288,7 @@ class PyEnvTask(EnvTask, PyTask):
         # in case of a specified worker environment
         if self.env and "_fw_env" in fw_spec \
                 and self.env in fw_spec["_fw_env"]:
-            self.logger.info("Found {:s}-specific block '{}' within worker file."
-                .format(self.env, fw_spec["_fw_env"]))
+            self.logger.info("Found %s-specific block '%s' within worker file.", self.env, fw_spec["_fw_env"])
 
             # """Parse global init block."""
             # _fw_env : env : init may provide a list of python commans
@@ -1280,7 +1299,7 @@ class PyEnvTask(EnvTask, PyTask):
                     init = [init]
                 assert isinstance(init, list)
                 for cmd in init:
-                    self.logger.info("Execute '{:s}'.".format(cmd))
+                    self.logger.info("Execute '%s'.", cmd)
                     self._py_hist_append(cmd)
                     exec(cmd)
 
@@ -1297,8 +1316,7 @@ class PyEnvTask(EnvTask, PyTask):
 
                 # so far, only simple overrides, no pre- or appending
                 for i, (key, value) in enumerate(env_dict.items()):
-                    self.logger.info("Set env var '{:s}' = '{:s}'.".format(
-                        key, value))
+                    self.logger.info("Set env var '%s' = '%s'.", key, value)
                     self._py_hist_append('os.environ["{:s}"] = "{:s}"'.format(
                         str(key), str(value)))
                     os.environ[str(key)] = str(value)
@@ -1310,7 +1328,7 @@ class PyEnvTask(EnvTask, PyTask):
                 init = [init]
             assert isinstance(init, list)
             for cmd in init:
-                self.logger.info("Execute '{:s}'.".format(cmd))
+                self.logger.info("Execute '%s'.", cmd)
                 self._py_hist_append(cmd)
                 exec(cmd)
 
@@ -1321,10 +1339,10 @@ class PyEnvTask(EnvTask, PyTask):
 
         args = list(self.get('args', []))  # defensive copy
 
-        self.logger.info("'args = {}'".format(args))
+        self.logger.info("'args = %s'", args)
 
         inputs = self.get('inputs', [])
-        self.logger.info("'inputs = {}'".format(inputs))
+        self.logger.info("'inputs = %s'", inputs)
 
         assert isinstance(inputs, list), "'inputs' must be list."
         for item in inputs:
@@ -1338,10 +1356,10 @@ class PyEnvTask(EnvTask, PyTask):
         else:
             kwargs = self.get('kwargs', {})
 
-        self.logger.info("'kwargs = {}'".format(kwargs))
+        self.logger.info("'kwargs = %s'", kwargs)
 
         kwargs_inputs = self.get('kwargs_inputs', {})
-        self.logger.info("'kwargs_inputs = {}'".format(kwargs_inputs))
+        self.logger.info("'kwargs_inputs = %s'", kwargs_inputs)
         assert isinstance(kwargs_inputs, dict), "'kwargs_inputs' must be dict."
         for kwarg_name, kwarg_key in kwargs_inputs.items():
             kwargs[kwarg_name] = get_nested_dict_value(fw_spec, kwarg_key)
@@ -1364,8 +1382,7 @@ class PyEnvTask(EnvTask, PyTask):
             self.logger.info("'type(output) == FWAction', return directly.")
             return output
 
-        self.logger.info("'type(output) == {}', build FWAction."
-            .format(type(output)))
+        self.logger.info("'type(output) == %s', build FWAction.", type(output))
         actions = {}
         outputs = self.get('outputs', [])
         assert isinstance(outputs, list)
@@ -1388,7 +1405,7 @@ class PyEnvTask(EnvTask, PyTask):
         if self.get('stored_data_varname'):
             actions['stored_data'] = {self['stored_data_varname']: output}
         if len(actions) > 0:
-            self.logger.info("Built actions '{}.'".format(actions))
+            self.logger.info("Built actions '%s.'", actions)
             return FWAction(**actions)
 
     def _load_params(self, d):
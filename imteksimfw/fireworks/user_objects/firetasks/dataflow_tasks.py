@@ -216,7 +216,7 @@ class SearchDictTask(DataflowTask):
         expand = from_fw_spec(expand, fw_spec)
 
         if input_key:
-            logger.debug("input from fw_spec at '%s'." % input_key)
+            logger.debug("input from fw_spec at '%s'.", input_key)
             input = get_nested_dict_value(fw_spec, input_key)
         elif input:
             pass
@@ -224,7 +224,7 @@ class SearchDictTask(DataflowTask):
             raise ValueError("Neither 'input' nor 'input_key' specified.")
 
         if search_key:
-            logger.debug("search from fw_spec at '%s'." % search_key)
+            logger.debug("search from fw_spec at '%s'.", search_key)
             search = get_nested_dict_value(fw_spec, search_key)
         elif input:
             pass
@@ -232,7 +232,7 @@ class SearchDictTask(DataflowTask):
             raise ValueError("Neither 'search' nor 'search_key' specified.")
 
         if marker_key:
-            logger.debug("marker from fw_spec at '%s'." % marker_key)
+            logger.debug("marker from fw_spec at '%s'.", marker_key)
             marker = get_nested_dict_value(fw_spec, marker_key)
         elif input:
             pass
@@ -251,7 +251,7 @@ class SearchDictTask(DataflowTask):
         matches = []
         def find_match(key, entry):
             if compare(entry, search, marker):
-                logger.info("Found match at %s: %s" % (key, entry))
+                logger.info("Found match at %s: %s", key, entry)
                 matches.append(key)
 
         if isinstance(input, dict):
@@ -263,20 +263,20 @@ class SearchDictTask(DataflowTask):
         else:
             ValueError("type of 'input' is '%s', but must be 'dict' or 'list'." % type(input))
 
-        logger.info("Found matches at '%s'" % matches)
+        logger.info("Found matches at '%s'", matches)
 
         if isinstance(limit, int) and limit >=0 :
             matches = matches[:limit]
-            logger.debug("Limit matches to first %d: '%s'" % (limit, matches))
+            logger.debug("Limit matches to first %d: '%s'", limit, matches)
 
         if expand and len(matches) == 1:
             matches = matches[0]
-            logger.debug("Expand single-entry result'%s'." % matches)
+            logger.debug("Expand single-entry result'%s'.", matches)
         elif expand and len(matches) == 0:
             matches = None
             logger.debug("Expand empty result as None.")
 
-        logger.info("Return '%s'" % matches)
+        logger.info("Return '%s'", matches)
         return matches
 
 
@@ -579,19 +579,18 @@ class BranchWorkflowTask(DataflowTask):
         logger = logging.getLogger(__name__)
 
         if fw_spec.get("_files_out"):
-            logger.info("Current FireWork's '_files_out': {}".format(
-                        fw_spec.get("_files_out")))
+            logger.info("Current FireWork's '_files_out': %s", fw_spec.get("_files_out"))
 
             files_prev = {}
 
             for k, v in fw_spec.get("_files_out").items():
                 files = glob.glob(os.path.join(os.curdir, v))
                 if files:
-                    logger.info("This Firework provides {}: {}".format(
-                                k, files), " within _files_out.")
+                    logger.info("This Firework provides %s: %s within _files_out.",
+                                k, files)
                     filepath = os.path.abspath(sorted(files)[-1])
-                    logger.info("{}: '{}' provided as '_files_prev'".format(
-                                k, filepath), " to subsequent FireWorks.")
+                    logger.info("%s: '%s' provided as '_files_prev' to subsequent FireWorks.",
+                                k, filepath)
                     files_prev[k] = filepath
 
             # get roots of insertion wf and assign _files_prev to them
@@ -611,10 +610,10 @@ class BranchWorkflowTask(DataflowTask):
         assert isinstance(self['split'], (str, list)), self['split']
         split_list = self['split']
         if isinstance(split_list, str): split_list = [split_list]
-        logger.debug("Iteratring through '{}'.", split_list)
+        logger.debug("Iteratring through '%s'.", split_list)
         reflen = 0
         for split in split_list:
-            logger.debug("Splitting field '{}'.", split)
+            logger.debug("Splitting field '%s'.", split)
             assert isinstance(fw_spec[split], list)
             # if isinstance(self['task']['inputs'], list):
             #    assert split in self['task']['inputs']
@@ -622,9 +621,9 @@ class BranchWorkflowTask(DataflowTask):
             #    assert split == self['task']['inputs']
 
             split_field = fw_spec[split]
-            logger.debug("Field content '{}'.".format(split_field))
+            logger.debug("Field content '%s'.", split_field)
             lensplit = len(split_field)
-            logger.debug("Length {}.".format(lensplit))
+            logger.debug("Length %s.", lensplit)
 
             # update reflen on first iteration
             if reflen == 0:
@@ -643,7 +642,7 @@ class BranchWorkflowTask(DataflowTask):
                 for i in range(0, lensplit, chunklen):
                     chunks[i // chunklen].update({split: split_field[i:i + chunklen]})
 
-            logger.debug("Split into {} chunks of length {}: {}.".format(nchunks, chunklen, chunks))
+            logger.debug("Split into %s chunks of length %s: %s.", nchunks, chunklen, chunks)
 
         chunk_index_spec = self.get('chunk index spec')
 
@@ -762,7 +761,7 @@ class BranchWorkflowTask(DataflowTask):
                 else:
                     detour_wf_base_spec = copy.deepcopy(minimal_base_spec)
 
-                logger.debug("Base spec for detour {}:".format(index))
+                logger.debug("Base spec for detour %s:", index)
                 _log_nested_dict(logger.debug, detour_wf_base_spec)
 
                 detour_wf, detour_wf_fw_id_mapping = self.appendable_wf_from_dict(
@@ -787,11 +786,13 @@ class BranchWorkflowTask(DataflowTask):
 
                 # only log if sepcific roots or leaves had been specified
                 if detour_fws_root:
-                    logger.debug("Mapped detour_wf root fw_ids {} onto newly created fw_ids {}".format(
-                        detour_fws_root, mapped_detour_fws_root[-len(detour_fws_root):]))
+                    logger.debug(
+                        "Mapped detour_wf root fw_ids %s onto newly created fw_ids %s",
+                        detour_fws_root, mapped_detour_fws_root[-len(detour_fws_root):])
                 if detour_fws_leaf:
-                    logger.debug("Mapped detour_wf leaf fw_ids {} onto newly created fw_ids {}".format(
-                        detour_fws_leaf, mapped_detour_fws_leaf[-len(detour_fws_leaf)]))
+                    logger.debug(
+                        "Mapped detour_wf leaf fw_ids %s onto newly created fw_ids %s",
+                        detour_fws_leaf, mapped_detour_fws_leaf[-len(detour_fws_leaf)])
 
                 if apply_mod_spec_to_detour_wf:
                     apply_mod_spec(detour_wf, fw_action, fw_ids=mapped_detour_fws_root)
@@ -812,7 +813,7 @@ class BranchWorkflowTask(DataflowTask):
                 else:
                     addition_wf_base_spec = copy.deepcopy(minimal_base_spec)
 
-                logger.debug("Base spec for addition {}:".format(index))
+                logger.debug("Base spec for addition %s:", index)
                 _log_nested_dict(logger.debug, addition_wf_base_spec)
 
                 addition_wf, addition_wf_fw_id_mapping = self.appendable_wf_from_dict(
@@ -828,8 +829,9 @@ class BranchWorkflowTask(DataflowTask):
                     mapped_addition_fws_root.append(addition_wf_fw_id_mapping[addition_fws_root])
 
                 if addition_fws_root:
-                    logger.debug("Mapped addition_wf root fw_ids {} onto newly created fw_ids {}".format(
-                        addition_fws_root, mapped_addition_fws_root[-len(addition_fws_root):]))
+                    logger.debug(
+                        "Mapped addition_wf root fw_ids %s onto newly created fw_ids %s",
+                        addition_fws_root, mapped_addition_fws_root[-len(addition_fws_root):])
 
                 self.write_files_prev(addition_wf, fw_spec, root_fw_ids=mapped_addition_fws_root)
                 logger.debug("addition_wf:")
@@ -848,7 +850,7 @@ class BranchWorkflowTask(DataflowTask):
         #       IndexError: list index out of range"
         if len(detour_wf_list) > 0:
             for index, detour_wf in enumerate(detour_wf_list):
-                logger.debug("detour_wf {}:".format(index))
+                logger.debug("detour_wf %s:", index)
             _log_nested_dict(logger.debug, detour_wf.as_dict())
 
             fw_action.detours = detour_wf_list
@@ -857,7 +859,7 @@ class BranchWorkflowTask(DataflowTask):
 
         if len(addition_wf_list) > 0:
             for index, addition_wf in enumerate(addition_wf_list):
-                logger.debug("addition_wf {}:".format(index))
+                logger.debug("addition_wf %s:", index)
             _log_nested_dict(logger.debug, addition_wf.as_dict())
 
             fw_action.additions = addition_wf_list
@@ -202,8 +202,7 @@ class DtoolLookupTask(RunAsChildProcessTask):
                     logger.debug("fw_spec level dtool config overrides:")
                     _log_nested_dict(logger.debug, dtool_config_update)
                 except Exception:  # key not found
-                    logger.warning("{} not found within fw_spec, ignored.".format(
-                        dtool_config_key))
+                    logger.warning("%s not found within fw_spec, ignored.", dtool_config_key)
             dtool_config.update(dtool_config_update)
             logger.debug("effective dtool config overrides:")
             _log_nested_dict(logger.debug, dtool_config)
@@ -316,7 +315,7 @@ class QueryDtoolTask(DtoolLookupTask):
         expand = from_fw_spec(expand, fw_spec)
 
         if query_key:
-            logger.debug("query from fw_spec at '%s'." % query_key)
+            logger.debug("query from fw_spec at '%s'.", query_key)
             query = get_nested_dict_value(fw_spec, query_key)
         elif input:
             pass
@@ -325,28 +324,26 @@ class QueryDtoolTask(DtoolLookupTask):
 
         r = dtool_lookup_api.query(query)
 
-        logger.debug("Server response: '{}'".format(r))
+        logger.debug("Server response: '%s'", r)
 
         if fizzle_empty_result and (len(r) == 0):
             raise ValueError("Query yielded empty result! (query: {})".format(
                 query))
 
         for doc in r:
-            logger.debug("Validating '{}'...".format(doc))
+            logger.debug("Validating '%s'...", doc)
             validate_dataset_info(doc)
 
         if sort_key:
-            logger.debug("Sorting by key '{}' and direction '{}'.".format(
-                         sort_key, sort_direction))
+            logger.debug("Sorting by key '%s' and direction '%s'.", sort_key, sort_direction)
             r = sorted(r, key=lambda d: d[sort_key],
                        reverse=(sort_direction == pymongo.DESCENDING))
-            logger.debug("Sorted server response: '{}'".format(r))
+            logger.debug("Sorted server response: '%s'", r)
 
         if limit:
-            logger.debug("Limiting response to the first {} enrties...".format(
-                         limit))
+            logger.debug("Limiting response to the first %s enrties...", limit)
             r = r[:limit]
-            logger.debug("Truncated server response: '{}'".format(r))
+            logger.debug("Truncated server response: '%s'", r)
 
         unique_dataset_names = set()  # track all used file names
 
@@ -362,13 +359,13 @@ class QueryDtoolTask(DtoolLookupTask):
 
         if expand and len(r) == 1:
             r = r[0]
-            logger.debug("Expand single-entry result'%s'." % r)
+            logger.debug("Expand single-entry result'%s'.", r)
         elif expand and len(r) == 0:
             r = None
             logger.debug("Expand empty result as None.")
 
         if meta_file:
-            logger.debug("Write response to file '{}'.".format(meta_file))
+            logger.debug("Write response to file '%s'.", meta_file)
             write_serialized(r, meta_file)
 
         return r
@@ -465,13 +462,13 @@ class ReadmeDtoolTask(DtoolLookupTask):
 
             if metadata_file:
                 metadata_file_path = os.path.join(dest_dir, metadata_file)
-                logger.debug("Write metadata of queried dataset to file '{}'.".format(metadata_file_path))
+                logger.debug("Write metadata of queried dataset to file '%s'.", metadata_file_path)
                 write_serialized(readme, metadata_file_path)
 
             if metadata_dtool_source_key and metadata_dtool_source_key != "":
                 dtool_metadata = get_nested_dict_value(readme, metadata_dtool_source_key)
                 logger.debug(
-                    "Forwarding '{}' subset of README metadata:".format(metadata_dtool_source_key))
+                    "Forwarding '%s' subset of README metadata:", metadata_dtool_source_key)
                 _log_nested_dict(logger.debug, dtool_metadata)
             else:
                 dtool_metadata = readme
@@ -482,7 +479,7 @@ class ReadmeDtoolTask(DtoolLookupTask):
                 logger.debug("Merging with fw_spec.")
             elif metadata_fw_source_key:
                 fw_metadata = get_nested_dict_value(fw_spec, metadata_fw_source_key)
-                logger.debug("Merging with '{}' subset of fw_spec:".format(metadata_fw_source_key))
+                logger.debug("Merging with '%s' subset of fw_spec:", metadata_fw_source_key)
                 _log_nested_dict(logger.debug, fw_metadata)
             else:
                 fw_metadata = {}
@@ -581,7 +578,7 @@ class ManifestDtoolTask(DtoolLookupTask):
 
             if manifest_file:
                 manifest_file_path = os.path.join(dest_dir, manifest_file)
-                logger.debug("Writing manifest of queried dataset to '{}'.".format(manifest_file_path))
+                logger.debug("Writing manifest of queried dataset to '%s'.", manifest_file_path)
                 write_serialized(manifest, manifest_file_path)
 
         return manifest
@@ -682,13 +679,13 @@ class DirectReadmeTask(DtoolLookupTask):
 
             if metadata_file:
                 metadata_file_path = os.path.join(dest_dir, metadata_file)
-                logger.debug("Write metadata of queried dataset to file '{}'.".format(metadata_file_path))
+                logger.debug("Write metadata of queried dataset to file '%s'.", metadata_file_path)
                 write_serialized(readme, metadata_file_path)
 
             if metadata_dtool_source_key and metadata_dtool_source_key != "":
                 dtool_metadata = get_nested_dict_value(readme, metadata_dtool_source_key)
                 logger.debug(
-                    "Forwarding '{}' subset of README metadata:".format(metadata_dtool_source_key))
+                    "Forwarding '%s' subset of README metadata:", metadata_dtool_source_key)
                 _log_nested_dict(logger.debug, dtool_metadata)
             else:
                 dtool_metadata = readme
@@ -699,7 +696,7 @@ class DirectReadmeTask(DtoolLookupTask):
                 logger.debug("Merging with fw_spec.")
             elif metadata_fw_source_key:
                 fw_metadata = get_nested_dict_value(fw_spec, metadata_fw_source_key)
-                logger.debug("Merging with '{}' subset of fw_spec:".format(metadata_fw_source_key))
+                logger.debug("Merging with '%s' subset of fw_spec:", metadata_fw_source_key)
                 _log_nested_dict(logger.debug, fw_metadata)
             else:
                 fw_metadata = {}
@@ -797,7 +794,7 @@ class DirectManifestTask(DtoolLookupTask):
 
             if manifest_file:
                 manifest_file_path = os.path.join(dest_dir, manifest_file)
-                logger.debug("Writing manifest of queried dataset to '{}'.".format(manifest_file_path))
+                logger.debug("Writing manifest of queried dataset to '%s'.", manifest_file_path)
                 write_serialized(manifest, manifest_file_path)
 
         return manifest
@@ -198,8 +198,7 @@ class DtoolTask(RunAsChildProcessTask):
                     logger.debug("fw_spec level dtool config overrides:")
                     _log_nested_dict(logger.debug, dtool_config_update)
                 except Exception:  # key not found
-                    logger.warning("{} not found within fw_spec, ignored.".format(
-                        dtool_config_key))
+                    logger.warning("%s not found within fw_spec, ignored.", dtool_config_key)
             dtool_config.update(dtool_config_update)
             logger.debug("effective dtool config overrides:")
             _log_nested_dict(logger.debug, dtool_config)
@@ -348,14 +347,13 @@ class CreateDatasetTask(DtoolTask):
                 "The dataset name can only be 80 characters long. "
                 "Valid characters: Alpha numeric characters [0-9a-zA-Z]"
                 "Valid special characters: - _ ."))
-        logger.info("Create dtool dataset '{}'.".format(name))
+        logger.info("Create dtool dataset '%s'.", name)
 
         creator_username = self.get(
             "creator_username", None)
         creator_username = from_fw_spec(creator_username, fw_spec)
         if creator_username is not None:
-            logger.info("Overriding system username with '{}'.".format(
-                creator_username))
+            logger.info("Overriding system username with '%s'.", creator_username)
 
         source_dataset_uri = self.get(
             "source_dataset_uri", None)
@@ -369,7 +367,7 @@ class CreateDatasetTask(DtoolTask):
             except TypeError as exc:
                 logger.error("'source_dataset_uri' must be str or list of str.")
                 raise exc
-            logger.info("Derive from 'source_dataset_uri': '{}'.".format(source_dataset_uri))
+            logger.info("Derive from 'source_dataset_uri': '%s'.", source_dataset_uri)
 
         source_dataset = self.get(
             "source_dataset", None)
@@ -383,7 +381,7 @@ class CreateDatasetTask(DtoolTask):
             except TypeError as exc:
                 logger.error("'source_dataset' must be dict or list of dict.")
                 raise exc
-            logger.info("Derive from 'source_dataset': '{}'.".format(source_dataset))
+            logger.info("Derive from 'source_dataset': '%s'.", source_dataset)
 
         if (source_dataset_uri is not None) and (source_dataset is not None):
             logger.info(
@@ -404,15 +402,13 @@ class CreateDatasetTask(DtoolTask):
                             d['uri'])
                     except dtoolcore.DtoolCoreTypeError as exc:
                         logger.warning(
-                            "Source dataset #{} with URI '{}' not accessible [{}]."
-                            .format(i, d['uri'], exc))
+                            "Source dataset #%s with URI '%s' not accessible [%s].", i, d['uri'], exc)
                     else:
                         logger.info(
-                            "Source dataset #{} has name '{}', uri '{}', and uuid '{}'."
-                            .format(i,
+                            "Source dataset #%s has name '%s', uri '%s', and uuid '%s'.", i,
                                     current_source_dataset.name,
                                     current_source_dataset.uri,
-                                    current_source_dataset.uuid))
+                                    current_source_dataset.uuid)
 
                         if 'name' in d and d['name'] != current_source_dataset.name:
                             logger.warning((
@@ -430,8 +426,7 @@ class CreateDatasetTask(DtoolTask):
                                     i, current_source_dataset.uuid, d["uuid"]))
                         d["uuid"] = current_source_dataset.uuid
                 else:
-                    logger.warning("Source dataset '{}' has no URI specified."
-                                .format(d))
+                    logger.warning("Source dataset '%s' has no URI specified.", d)
 
         source_dataset_annotation = self.get(
             "source_dataset_annotation", True)
@@ -444,8 +439,7 @@ class CreateDatasetTask(DtoolTask):
         dtool_readme_template_path = self.get(
             "dtool_readme_template_path", None)
         dtool_readme_template_path = from_fw_spec(dtool_readme_template_path, fw_spec)
-        logger.info("Use dtool README.yml template '{}'.".format(
-            dtool_readme_template_path))
+        logger.info("Use dtool README.yml template '%s'.", dtool_readme_template_path)
 
         dtool_readme_template = _get_readme_template(
             dtool_readme_template_path)
@@ -463,13 +457,13 @@ class CreateDatasetTask(DtoolTask):
                 abspaths = [os.path.abspath(p) for p in self["paths"]]
             else:
                 logger.info("Treating 'paths' field as glob pattern.")
-                logger.info("Searching within '{}'.".format(directory))
+                logger.info("Searching within '%s'.", directory)
                 relpaths = list(
                     glob.glob("{}/{}".format(directory, self["paths"])))
                 abspaths = [os.path.abspath(p) for p in relpaths]
         else:  # everything within cwd
             logger.info("'paths' not specified,")
-            logger.info("Adding all content of '{}'.".format(directory))
+            logger.info("Adding all content of '%s'.", directory)
             relpaths = []
             abspaths = []
             # just list files, not directories
@@ -577,16 +571,16 @@ class CreateDatasetTask(DtoolTask):
                     try:
                         first_source_dataset = dtoolcore.DataSet.from_uri(d["uri"])
                     except dtoolcore.DtoolCoreTypeError as exc:
-                        logger.warning("Source dataset #{} with URI '{}' not accessible ( ), skipped.".format(
-                                       i, d['uri'], exc))
+                        logger.warning("Source dataset #%s with URI '%s' not accessible (%s), skipped.",
+                                       i, d['uri'], exc)
                     else:
-                        logger.info("Found source dataset #{} with URI '{}' accessible.".format(i, d['uri']))
+                        logger.info("Found source dataset #%s with URI '%s' accessible.", i, d['uri'])
                         logger.info(
-                            "Source dataset has name '{}', uri '{}', and uuid '{}'."
-                            .format(first_source_dataset.name, first_source_dataset.uri, first_source_dataset.uuid))
+                            "Source dataset has name '%s', uri '%s', and uuid '%s'.",
+                            first_source_dataset.name, first_source_dataset.uri, first_source_dataset.uuid)
                         break
                 else:
-                    logger.warning("Source dataset #{} has no URI field, skipped.".format(i))
+                    logger.warning("Source dataset #%s has no URI field, skipped.", i)
             if first_source_dataset is None:
                 logger.warning((
                     "None of specified source datasets accessible. "
@@ -613,13 +607,12 @@ class CreateDatasetTask(DtoolTask):
         # add items to dataset one by one
         # TODO: possibility for per-item metadata
         for abspath, relpath in zip(abspaths, relpaths):
-            logger.info("Add '{}' as '{}' to dataset '{}'.".format(
-                abspath, relpath, proto_dataset.name))
+            logger.info("Add '%s' as '%s' to dataset '%s'.", abspath, relpath, proto_dataset.name)
             proto_dataset.put_item(abspath, relpath)
 
         logger.info(
-            "Created new dataset with name '{}', uri '{}', and uuid '{}'."
-            .format(proto_dataset.name, proto_dataset.uri, proto_dataset.uuid))
+            "Created new dataset with name '%s', uri '%s', and uuid '%s'.",
+            proto_dataset.name, proto_dataset.uri, proto_dataset.uuid)
 
         return proto_dataset
 
@@ -652,14 +645,13 @@ class FreezeDatasetTask(DtoolTask):
         uri = from_fw_spec(uri, fw_spec)
 
         proto_dataset = dtoolcore.ProtoDataSet.from_uri(uri)
-        logger.info("Freezing dataset '{}' with URI '{}'.".format(
-            proto_dataset.name, proto_dataset.uri))
+        logger.info("Freezing dataset '%s' with URI '%s'.", proto_dataset.name, proto_dataset.uri)
 
         # freeze dataset
         # see https://github.com/jic-dtool/dtool-create/blob/0a772aa5157523a7219963803293d4e521bc1aa2/dtool_create/dataset.py#L438
 
         num_items = len(list(proto_dataset._identifiers()))
-        logger.info("{} items in dataset '{}'.".format(num_items, proto_dataset.name))
+        logger.info("%s items in dataset '%s'.", num_items, proto_dataset.name)
         max_files_limit = int(dtoolcore.utils.get_config_value(
             "DTOOL_MAX_FILES_LIMIT",
             default=10000
@@ -732,8 +724,8 @@ class CopyDatasetTask(DtoolTask):
             admin_metadata=src_dataset._admin_metadata,
             base_uri=target
         )
-        logger.info("Copy from '{}'".format(source))
-        logger.info("  to '{}'.".format(dest_uri))
+        logger.info("Copy from '%s'", source)
+        logger.info("  to '%s'.", dest_uri)
 
         if not resume:
             # Check if the destination URI is already a dataset
@@ -759,7 +751,7 @@ class CopyDatasetTask(DtoolTask):
             src_uri=source,
             dest_base_uri=target,
         )
-        logger.info("Copied to '{}'.".format(target_uri))
+        logger.info("Copied to '%s'.", target_uri)
 
         target_dataset = dtoolcore.DataSet.from_uri(target_uri)
 
@@ -812,15 +804,15 @@ class FetchItemTask(DtoolTask):
         src_dataset = dtoolcore.DataSet.from_uri(source)
         local_path = src_dataset.item_content_abspath(item_id)
 
-        logger.debug("Local path of '%s' in '%s': %s" % (item_id, source, local_path))
+        logger.debug("Local path of '%s' in '%s': %s", item_id, source, local_path)
 
         if filename is None:
             filename = os.path.basename(local_path)
-            logger.debug("No explicit filename specified, using '%s'." % filename)
+            logger.debug("No explicit filename specified, using '%s'.", filename)
 
         dest = os.path.join(dest_dir, filename)
 
-        logger.info("Copy from '%s' to '%s'" % (local_path, dest))
+        logger.info("Copy from '%s' to '%s'", local_path, dest)
         shutil.copy(local_path, dest)
 
         return src_dataset
\ No newline at end of file
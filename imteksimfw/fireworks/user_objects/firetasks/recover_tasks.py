@@ -412,19 +412,18 @@ class RecoverTask(FiretaskBase):
         logger = logging.getLogger(__name__)
 
         if fw_spec.get("_files_out"):
-            logger.info("Current FireWork's '_files_out': {}".format(
-                        fw_spec.get("_files_out")))
+            logger.info("Current FireWork's '_files_out': %s", fw_spec.get("_files_out"))
 
             files_prev = {}
 
             for k, v in fw_spec.get("_files_out").items():
                 files = glob.glob(os.path.join(os.curdir, v))
                 if files:
-                    logger.info("This Firework provides {}: {}".format(
-                                k, files), " within _files_out.")
+                    logger.info("This Firework provides %s: %s within _files_out.",
+                                k, files)
                     filepath = os.path.abspath(sorted(files)[-1])
-                    logger.info("{}: '{}' provided as '_files_prev'".format(
-                                k, filepath), " to subsequent FireWorks.")
+                    logger.info("%s: '%s' provided as '_files_prev' to subsequent FireWorks.",
+                                k, filepath)
                     files_prev[k] = filepath
 
             # get roots of insertion wf and assign _files_prev to them
@@ -613,13 +612,12 @@ class RecoverTask(FiretaskBase):
                 # all possible restart files. If not:
                 if len(restart_file_glob_patterns) != len(restart_file_dests):
                     logger.warning(
-                        "There are {} restart_file_glob_patterns, "
-                        "but {} restart_file_dests, latter ignored. "
+                        "There are %s restart_file_glob_patterns, "
+                        "but %s restart_file_dests, latter ignored. "
                         "Specify none, a single or one "
                         "restart_file_dest per restart_file_glob_patterns "
-                        "a Every restart file glob pattern ".format(
-                            len(restart_file_glob_patterns),
-                            len(restart_file_dests)))
+                        "a Every restart file glob pattern ", len(restart_file_glob_patterns),
+                            len(restart_file_dests))
                     # fall back to default
                     restart_file_dests = [os.curdir]*len(
                         restart_file_glob_patterns)
@@ -636,12 +634,9 @@ class RecoverTask(FiretaskBase):
                 job_info_array = fw_spec['_job_info']
                 prev_job_info = job_info_array[-1]
                 path_prefix = prev_job_info['launch_dir']
-                logger.info('The name of the previous job was: {}'.format(
-                    prev_job_info['name']))
-                logger.info('The id of the previous job was: {}'.format(
-                    prev_job_info['fw_id']))
-                logger.info('The location of the previous job was: {}'.format(
-                    path_prefix))
+                logger.info('The name of the previous job was: %s', prev_job_info['name'])
+                logger.info('The id of the previous job was: %s', prev_job_info['fw_id'])
+                logger.info('The location of the previous job was: %s', path_prefix)
             # TODO: fails for several parents if the "wrong" parent fizzles
             # pull from fizzled previous FW:
             elif '_fizzled_parents' in fw_spec:
@@ -651,14 +646,11 @@ class RecoverTask(FiretaskBase):
                 # pull latest launch
                 path_prefix = prev_job_info['launches'][-1]['launch_dir']
                 logger.info(
-                    'The name of fizzled parent Firework was: {}'.format(
-                        prev_job_info['name']))
+                    'The name of fizzled parent Firework was: %s', prev_job_info['name'])
                 logger.info(
-                    'The id of fizzled parent Firework was: {}'.format(
-                        prev_job_info['fw_id']))
+                    'The id of fizzled parent Firework was: %s', prev_job_info['fw_id'])
                 logger.info(
-                    'The location of fizzled parent Firework was: {}'.format(
-                        path_prefix))
+                    'The location of fizzled parent Firework was: %s', path_prefix)
             else:  # no info about previous (fizzled or other) jobs
                 logger.info(
                     'No information about previous (fizzled or other) jobs available.')
@@ -679,8 +671,7 @@ class RecoverTask(FiretaskBase):
                     other_glob_patterns = [other_glob_patterns]
                 for other_glob_pattern in other_glob_patterns:
                     if isinstance(other_glob_pattern, str):  # avoid non string objs
-                        logger.info("Processing glob pattern {}".format(
-                            other_glob_pattern))
+                        logger.info("Processing glob pattern %s", other_glob_pattern)
                         file_list.extend(
                             glob.glob(
                                 os.path.join(
@@ -690,15 +681,14 @@ class RecoverTask(FiretaskBase):
                 # copy other files if necessary
                 if len(file_list) > 0:
                     for f in file_list:
-                        logger.info("File {} will be forwarded.".format(f))
+                        logger.info("File %s will be forwarded.", f)
                         try:
                             dest = os.getcwd()
                             shutil.copy(f, dest)
                         except Exception as exc:
                             if ignore_errors:
                                 logger.warning("There was an error copying "
-                                               "'{}' to '{}', ignored:".format(
-                                                   f, dest))
+                                               "'%s' to '%s', ignored:", f, dest)
                                 logger.warning(exc)
                             else:
                                 raise exc
@@ -715,22 +705,20 @@ class RecoverTask(FiretaskBase):
                     if len(restart_file_matches) > 1:
                         sorted_restart_file_matches = sorted(
                             restart_file_matches, key=os.path.getmtime)  # sort by modification time
-                        logger.info("Several restart files {} (most recent last) "
-                                    "for glob pattern '{}'.".format(
-                                        glob_pattern,
-                                        sorted_restart_file_matches))
-                        logger.info("Modification times for those files: {}".format(
-                            [os.path.getmtime(f) for f in sorted_restart_file_matches]))
-                        logger.info("Most recent restart file '{}' will be copied "
-                                    "to '{}'.".format(
-                                        sorted_restart_file_matches[-1], dest))
+                        logger.info("Several restart files %s (most recent last) "
+                                    "for glob pattern '%s'.", glob_pattern,
+                                        sorted_restart_file_matches)
+                        logger.info(
+                            "Modification times for those files: %s",
+                            [os.path.getmtime(f) for f in sorted_restart_file_matches])
+                        logger.info("Most recent restart file '%s' will be copied "
+                                    "to '%s'.", sorted_restart_file_matches[-1], dest)
                         restart_file_list.append(
                             (sorted_restart_file_matches[-1], dest))
                     elif len(restart_file_matches) == 1:
-                        logger.info("One restart file '{}' for glob "
-                                    "pattern '{}' will be copied to '{}'.".format(
-                                        restart_file_matches[0],
-                                        glob_pattern, dest))
+                        logger.info("One restart file '%s' for glob "
+                                    "pattern '%s' will be copied to '%s'.", restart_file_matches[0],
+                                        glob_pattern, dest)
                         restart_file_list.append(
                             (restart_file_matches[0], dest))
                     else:
@@ -744,14 +732,12 @@ class RecoverTask(FiretaskBase):
                 if len(restart_file_list) > 0:
                     for current_restart_file, dest in restart_file_list:
                         current_restart_file_basename = os.path.basename(current_restart_file)
-                        logger.info("File {} will be forwarded.".format(
-                            current_restart_file_basename))
+                        logger.info("File %s will be forwarded.", current_restart_file_basename)
                         try:
                             shutil.copy(current_restart_file, dest)
                         except Exception as exc:
-                            logger.error("There was an error copying from {} "
-                                         "to {}".format(
-                                             current_restart_file, dest))
+                            logger.error("There was an error copying from %s "
+                                         "to %s", current_restart_file, dest)
                             raise exc
 
             # distinguish between FireWorks and Workflows by top-level keys
@@ -796,11 +782,13 @@ class RecoverTask(FiretaskBase):
 
                 # only log if sepcific roots or leaves had been specified
                 if detour_fws_root:
-                    logger.debug("Mapped detour_wf root fw_ids {} onto newly created fw_ids {}".format(
-                        detour_fws_root, mapped_detour_fws_root[-len(detour_fws_root):]))
+                    logger.debug(
+                        "Mapped detour_wf root fw_ids %s onto newly created fw_ids %s",
+                        detour_fws_root, mapped_detour_fws_root[-len(detour_fws_root):])
                 if detour_fws_leaf:
-                    logger.debug("Mapped detour_wf leaf fw_ids {} onto newly created fw_ids {}".format(
-                        detour_fws_leaf, mapped_detour_fws_leaf[-len(detour_fws_leaf)]))
+                    logger.debug(
+                        "Mapped detour_wf leaf fw_ids %s onto newly created fw_ids %s",
+                        detour_fws_leaf, mapped_detour_fws_leaf[-len(detour_fws_leaf)])
 
             if detour_wf is not None:
                 logger.debug(
@@ -817,8 +805,7 @@ class RecoverTask(FiretaskBase):
                             prev_job_info['spec'], restart_counter)
                     except KeyError:
                         logger.warning("Found no restart count in fw_spec of "
-                                       "fizzled parent at key '{}.'".format(
-                                            restart_counter))
+                                       "fizzled parent at key '%s.'", restart_counter)
 
                 # if none found, look in own fw_spec
                 if restart_count is None:
@@ -827,7 +814,7 @@ class RecoverTask(FiretaskBase):
                             prev_job_info['spec'], restart_counter)
                     except KeyError:
                         logger.warning("Found no restart count in own fw_spec "
-                                       "at key '{}.'".format(restart_counter))
+                                       "at key '%s.'", restart_counter)
 
                 # if still none found, assume it's the 1st
                 if restart_count is None:
@@ -837,8 +824,7 @@ class RecoverTask(FiretaskBase):
 
                 if restart_count < max_restarts + 1:
                     logger.info(
-                        "This is #{:d} of at most {:d} restarts.".format(
-                            restart_count, max_restarts))
+                        "This is #%d of at most %d restarts.", restart_count, max_restarts)
 
                     restart_wf_base_spec = None
                     if superpose_restart_on_parent_fw_spec:
@@ -870,16 +856,19 @@ class RecoverTask(FiretaskBase):
                         mapped_detour_fws_leaf.append(restart_wf_fw_id_mapping[restart_fws_leaf])
 
                     if restart_fws_root:
-                        logger.debug("Mapped restart_wf root fw_ids {} onto newly created fw_ids {}".format(
-                            restart_fws_root, mapped_detour_fws_root[-len(restart_fws_root):]))
+                        logger.debug(
+                            "Mapped restart_wf root fw_ids %s onto newly created fw_ids %s",
+                            restart_fws_root, mapped_detour_fws_root[-len(restart_fws_root):])
                     if restart_fws_leaf:
-                        logger.debug("Mapped restart_wf leaf fw_ids {} onto newly created fw_ids {}".format(
-                            restart_fws_leaf, mapped_detour_fws_leaf[-len(restart_fws_leaf)]))
+                        logger.debug(
+                            "Mapped restart_wf leaf fw_ids %s onto newly created fw_ids %s",
+                            restart_fws_leaf, mapped_detour_fws_leaf[-len(restart_fws_leaf)])
 
                     # apply updates to fw_spec
                     for fw in restart_wf.fws:
-                        logger.debug("Insert restart counter '{}': {} into fw_id {}: '{}'.".format(
-                            restart_counter, restart_count, fw.fw_id, fw.name))
+                        logger.debug(
+                            "Insert restart counter '%s': %s into fw_id %s: '%s'.",
+                            restart_counter, restart_count, fw.fw_id, fw.name)
                         set_nested_dict_value(
                             fw.spec, restart_counter, restart_count)
 
@@ -898,10 +887,11 @@ class RecoverTask(FiretaskBase):
                     recover_fw_spec = dict_merge({}, fw_spec,
                                                  merge_exclusions=fw_spec_to_exclude_dict)
                     set_nested_dict_value(recover_fw_spec, restart_counter, restart_count)
-                    logger.debug("Insert restart counter '{}': {} into recover_fw.spec.".format(
-                                 restart_counter, restart_count))
-                    logger.debug("Propagate fw_spec = {} to subsequent "
-                                 "recover_fw.".format(recover_fw_spec))
+                    logger.debug(
+                        "Insert restart counter '%s': %s into recover_fw.spec.",
+                        restart_counter, restart_count)
+                    logger.debug("Propagate fw_spec = %s to subsequent "
+                                 "recover_fw.", recover_fw_spec)
 
                     # merge insertions
                     #
@@ -937,10 +927,10 @@ class RecoverTask(FiretaskBase):
                         name=repeated_recover_fw_name,
                         fw_id=self.consecutive_fw_id)
                     self.consecutive_fw_id -= 1
-                    logger.info("Create repeated recover Firework {} with "
-                                "id {} and specs {}".format(recover_fw.name,
+                    logger.info("Create repeated recover Firework %s with "
+                                "id %s and specs %s", recover_fw.name,
                                                             recover_fw.fw_id,
-                                                            recover_fw.spec))
+                                                            recover_fw.spec)
 
                     recover_wf = Workflow([recover_fw])
 
@@ -950,8 +940,8 @@ class RecoverTask(FiretaskBase):
                     mapped_detour_fws_leaf = recover_wf.leaf_fw_ids
                 else:
                     logger.warning(
-                        "Maximum number of {} restarts reached. "
-                        "No further restart.".format(max_restarts))
+                        "Maximum number of %s restarts reached. "
+                        "No further restart.", max_restarts)
             else:
                 logger.warning("No restart Fireworks appended.")
 
@@ -984,8 +974,9 @@ class RecoverTask(FiretaskBase):
                     mapped_addition_fws_root.append(addition_wf_fw_id_mapping[addition_fws_root])
 
                 if addition_fws_root:
-                    logger.debug("Mapped addition_wf root fw_ids {} onto newly created fw_ids {}".format(
-                        addition_fws_root, mapped_addition_fws_root[-len(addition_fws_root):]))
+                    logger.debug(
+                        "Mapped addition_wf root fw_ids %s onto newly created fw_ids %s",
+                        addition_fws_root, mapped_addition_fws_root[-len(addition_fws_root):])
 
                 self.write_files_prev(addition_wf, fw_spec, root_fw_ids=mapped_addition_fws_root)
 
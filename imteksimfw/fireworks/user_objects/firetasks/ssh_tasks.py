@@ -31,18 +31,14 @@ from contextlib import ExitStack
 
 import io
 import logging
+import os
 import os.path
-import select
+import selectors
 import socket
+import tempfile
 import threading
 import time
 
-try:
-    import SocketServer
-except ImportError:
-    import socketserver as SocketServer
-import paramiko
-
 from fireworks.fw_config import FW_LOGGING_FORMAT
 from fireworks.core.firework import FWAction
 from fireworks.utilities.dict_mods import get_nested_dict_value
@@ -54,6 +50,47 @@ from imteksimfw.utils.logging import LoggingContext
 DEFAULT_FORMATTER = logging.Formatter(FW_LOGGING_FORMAT)
 
 
+# paramiko transports cached per jump host: repeated tunnel setups within
+# one process skip the TCP connect, key exchange and userauth
+_TRANSPORTS = {}
+_TRANSPORTS_LOCK = threading.Lock()
+
+
+def _get_transport(ssh_host, ssh_port, ssh_user, ssh_keyfile):
+    """Return a cached, active paramiko Transport, (re)connecting if needed.
+
+    Note: SSHForwardTask runs in a fresh child process per task, so on
+    that call path the cache never hits; it only pays off for callers
+    that set up several tunnels within one process.
+    """
+    # defer the heavy paramiko import to the actual tunnel setup so that
+    # merely importing (or deserializing) the task stays cheap
+    import paramiko
+
+    ssh_keyfile = os.path.expanduser(ssh_keyfile)
+    # the keyfile is part of the key: a transport authenticated with
+    # one identity must not satisfy a request for another
+    key = (ssh_host, ssh_port, ssh_user, ssh_keyfile)
+    with _TRANSPORTS_LOCK:
+        transport = _TRANSPORTS.get(key)
+        if transport is not None and transport.is_active():
+            return transport
+
+        transport = paramiko.Transport((ssh_host, ssh_port))
+        pkey = paramiko.RSAKey.from_private_key_file(ssh_keyfile)
+
+        transport.connect(hostkey=None,
+                          username=ssh_user,
+                          password=None,
+                          pkey=pkey)
+        # periodic keepalives prevent NAT gateways from silently dropping
+        # an idle tunnel, which would force a full reconnect
+        transport.set_keepalive(30)
+
+        _TRANSPORTS[key] = transport
+        return transport
+
+
 def from_fw_spec(param, fw_spec):
     """Expands param['key'] as key within fw_spec.
 
@@ -67,72 +104,138 @@ def from_fw_spec(param, fw_spec):
     return ret
 
 
-class ForwardServer(SocketServer.ThreadingTCPServer):
-    """
-    This class has been copied and modified from the original paramiko
-    repository at
-    https://github.com/paramiko/paramiko/blob/master/demos/forward.py
-    and underlies the GNU Lesser General Public Licesnse v 2.1 at
-    https://github.com/paramiko/paramiko/blob/master/LICENSE.
-    """
-    daemon_threads = True
-    allow_reuse_address = True
-
+class ForwardServer:
+    """Single-threaded TCP port forwarding server.
 
-class Handler(SocketServer.BaseRequestHandler):
-    """
-    This class has been copied and modified from the original paramiko
-    repository at
+    Relay loop inspired by the select-based handler in the original
+    paramiko repository at
     https://github.com/paramiko/paramiko/blob/master/demos/forward.py
-    and underlies the GNU Lesser General Public Licesnse v 2.1 at
-    https://github.com/paramiko/paramiko/blob/master/LICENSE.
+    (GNU Lesser General Public License v 2.1 at
+    https://github.com/paramiko/paramiko/blob/master/LICENSE), but
+    multiplexes listener, local sockets and ssh channels of all tunnel
+    connections on a single 'selectors.DefaultSelector' loop instead of
+    spawning one handler thread per connection.
     """
-    def handle(self):
+    def __init__(self, server_address, ssh_transport,
+                 chain_host, chain_port):
+        self.ssh_transport = ssh_transport
+        self.chain_host = chain_host
+        self.chain_port = chain_port
+
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(server_address)
+        self._listener.listen()
+        self.server_address = self._listener.getsockname()
+
+        self._selector = selectors.DefaultSelector()
+        self._counterpart = {}  # local socket <-> ssh channel, both ways
+        self._peername = {}  # local socket -> remote address for logging
+        self._shutdown_request = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.server_close()
+
+    def serve_forever(self, poll_interval=0.5):
+        """Accept and relay connections until shutdown() is called."""
+        self._selector.register(self._listener, selectors.EVENT_READ)
+        try:
+            while not self._shutdown_request:
+                events = self._selector.select(poll_interval)
+                for key, _ in events:
+                    if key.fileobj is self._listener:
+                        self._accept()
+                    else:
+                        self._relay(key.fileobj)
+        finally:
+            self._selector.unregister(self._listener)
+
+    def shutdown(self):
+        """Make serve_forever() loop exit, possibly from another thread."""
+        self._shutdown_request = True
+
+    def server_close(self):
+        for request in list(self._peername):
+            self._close_pair(request, self._counterpart[request])
+        self._listener.close()
+        self._selector.close()
+
+    def _accept(self):
         logger = logging.getLogger(__name__)
+        try:
+            request, peername = self._listener.accept()
+        except OSError:  # connection aborted before it was accepted
+            return
         try:
             chan = self.ssh_transport.open_channel(
                 "direct-tcpip",
                 (self.chain_host, self.chain_port),
-                self.request.getpeername(),
+                peername,
             )
         except Exception as e:
             logger.info(
-                "Incoming request to %s:%d failed: %s"
-                % (self.chain_host, self.chain_port, repr(e))
+                "Incoming request to %s:%d failed: %s",
+                self.chain_host, self.chain_port, repr(e)
             )
+            request.close()
             return
         if chan is None:
             logger.info(
-                "Incoming request to %s:%d was rejected by the SSH server."
-                % (self.chain_host, self.chain_port)
+                "Incoming request to %s:%d was rejected by the SSH server.",
+                self.chain_host, self.chain_port
             )
+            request.close()
             return
 
+        try:
+            chan_peername = chan.getpeername()
+        except OSError:  # channel already gone again, only log cosmetics
+            chan_peername = None
+
         logger.info(
-            "Connected!  Tunnel open %r -> %r -> %r"
-            % (
-                self.request.getpeername(),
-                chan.getpeername(),
-                (self.chain_host, self.chain_port),
-            )
+            "Connected!  Tunnel open %r -> %r -> %r",
+            peername,
+            chan_peername,
+            (self.chain_host, self.chain_port),
         )
-        while True:
-            r, w, x = select.select([self.request, chan], [], [])
-            if self.request in r:
-                data = self.request.recv(1024)
-                if len(data) == 0:
-                    break
-                chan.send(data)
-            if chan in r:
-                data = chan.recv(1024)
-                if len(data) == 0:
-                    break
-                self.request.send(data)
-
-        peername = self.request.getpeername()
-        chan.close()
-        self.request.close()
-        logger.info("Tunnel closed from %r" % (peername,))
+        self._counterpart[request] = chan
+        self._counterpart[chan] = request
+        self._peername[request] = peername
+        self._selector.register(request, selectors.EVENT_READ)
+        self._selector.register(chan, selectors.EVENT_READ)
+
+    def _relay(self, source):
+        counterpart = self._counterpart.get(source)
+        if counterpart is None:  # pair torn down earlier in this batch
+            return
+        try:
+            data = source.recv(1024)
+        except OSError:
+            data = b''
+        if len(data) == 0:
+            self._close_pair(source, counterpart)
+            return
+        try:
+            counterpart.sendall(data)
+        except OSError:
+            # counterpart reset with data still in flight: confine the
+            # damage to this pair instead of killing the shared loop
+            self._close_pair(source, counterpart)
+
+    def _close_pair(self, a, b):
+        logger = logging.getLogger(__name__)
+        peername = self._peername.pop(a, None) or self._peername.pop(b, None)
+        for endpoint in (a, b):
+            del self._counterpart[endpoint]
+            try:
+                self._selector.unregister(endpoint)
+            except KeyError:
+                pass
+            endpoint.close()
+        logger.info("Tunnel closed from %r", peername)
 
 
 class SSHForwardTask(RunAsChildProcessTask):
@@ -244,40 +347,34 @@ class SSHForwardTask(RunAsChildProcessTask):
 
             logger = logging.getLogger(__name__)
 
-            # allocate free local port if none specified
-            # inspired by
-            #   https://www.scivision.dev/python-get-free-network-port
-            # and
-            #   http://code.activestate.com/recipes/531822-pick-unused-port
-            if local_port is None:
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.bind(('localhost', 0))
-                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                addr, local_port = s.getsockname()
-                logger.info(
-                    "Allocated free local port: {:d}".format(local_port))
-
-            # write port number to file for communication with other processes
-            if isinstance(port_file, str):
-                with open(port_file, mode='w') as f:
-                    f.write(str(local_port))
-                logger.info("Wrote port number to '{}'".format(port_file))
-
-            transport = paramiko.Transport((ssh_host, ssh_port))
-            pkey = paramiko.RSAKey.from_private_key_file(
-                os.path.expanduser(ssh_keyfile))
+            transport = _get_transport(
+                ssh_host, ssh_port, ssh_user, ssh_keyfile)
 
-            transport.connect(hostkey=None,
-                              username=ssh_user,
-                              password=None,
-                              pkey=pkey)
-
-            class SubHander(Handler):
-                chain_host = remote_host
-                chain_port = remote_port
-                ssh_transport = transport
+            # bind the actual listener to port 0 if no local port
+            # specified and let the kernel pick a free one; probing with
+            # a throwaway socket first would leave a window for another
+            # process to snatch the port in between
+            with ForwardServer(("", local_port or 0), transport,
+                               remote_host, remote_port) as server:
+                local_port = server.server_address[1]
+                logger.info(
+                    "Tunnel listens on local port: %d", local_port)
+
+                # write port number to file for communication with other
+                # processes
+                if isinstance(port_file, str):
+                    # write to temporary file first and rename atomically:
+                    # concurrent readers see either the complete port number
+                    # or no file at all, never a truncated write
+                    port_file_dir = os.path.dirname(port_file) or '.'
+                    with tempfile.NamedTemporaryFile(
+                            mode='w', dir=port_file_dir, delete=False) as f:
+                        f.write(str(local_port))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(f.name, port_file)
+                    logger.info("Wrote port number to '%s'", port_file)
 
-            with ForwardServer(("", local_port), SubHander) as server:
                 # if a stop signal is to be expected, then run server in
                 # separate thread and forward stop signal
                 if e is not None:
@@ -287,8 +384,8 @@ class SSHForwardTask(RunAsChildProcessTask):
                     server_thread.daemon = True
                     server_thread.start()
                     logger.info(
-                        "Server loop running in thread '{}'".format(
-                            server_thread.name))
+                        "Server loop running in thread '%s'",
+                        server_thread.name)
 
                     while server_thread.is_alive():
                         if e.is_set():
@@ -300,10 +397,4 @@ class SSHForwardTask(RunAsChildProcessTask):
 
                 logger.info("Server stoped.")
 
-            try:
-                logger.info("Trying to close socket.")
-                s.close()  # fails if s does not exist
-            except Exception:
-                logger.info("Apparently already closed.")
-
         q.put(FWAction())
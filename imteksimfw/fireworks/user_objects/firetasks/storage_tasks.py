@@ -205,7 +205,7 @@ class GetObjectFromFilepadTask(FiretaskBase):
                     raise ValueError("Query yielded empty result! (query: {:s})".format(
                         json.dumps(query)))
                 else:
-                    logger.info("Query yielded empty result! (query: {:s})".format(json.dumps(query)))
+                    logger.info("Query yielded empty result! (query: %s)", json.dumps(query))
             else:
                 file_contents, doc = fpad._get_file_contents(d)
                 logger.debug("Metadata of queried object:")
@@ -217,7 +217,7 @@ class GetObjectFromFilepadTask(FiretaskBase):
 
                 if metadata_file:
                     metadata_file_path = os.path.join(dest_dir, metadata_file)
-                    logger.debug("Writing metadata of queried object to '{}'.".format(metadata_file_path))
+                    logger.debug("Writing metadata of queried object to '%s'.", metadata_file_path)
                     with open(metadata_file_path, "w") as f:
                         yaml = YAML()
                         yaml.dump(doc, f)
@@ -226,7 +226,7 @@ class GetObjectFromFilepadTask(FiretaskBase):
                     if metadata_fp_source_key and metadata_fp_source_key != "":
                         fp_metadata = get_nested_dict_value(doc, metadata_fp_source_key)
                         logger.debug(
-                            "Forwarding '{}' subset of filepad object metadata:".format(metadata_fp_source_key))
+                            "Forwarding '%s' subset of filepad object metadata:", metadata_fp_source_key)
                         _log_nested_dict(logger.debug, fp_metadata)
                     else:
                         fp_metadata = doc
@@ -237,7 +237,7 @@ class GetObjectFromFilepadTask(FiretaskBase):
                         logger.debug("Merging with fw_spec.")
                     elif metadata_fw_source_key:
                         fw_metadata = get_nested_dict_value(fw_spec, metadata_fw_source_key)
-                        logger.debug("Merging with '{}' subset of fw_spec:".format(metadata_fw_source_key))
+                        logger.debug("Merging with '%s' subset of fw_spec:", metadata_fw_source_key)
                         _log_nested_dict(logger.debug, fw_metadata)
                     else:
                         fw_metadata = {}
@@ -251,7 +251,7 @@ class GetObjectFromFilepadTask(FiretaskBase):
                                               exclusions=metadata_fw_exclusions,
                                               merge_exclusions=metadata_fp_exclusions)
 
-                    logger.debug("Forwarding merge into '{}':".format(metadata_fw_dest_key))
+                    logger.debug("Forwarding merge into '%s':", metadata_fw_dest_key)
                     _log_nested_dict(logger.debug, metadata)
 
                     mod_spec.append({dict_mod: {metadata_fw_dest_key: metadata}})
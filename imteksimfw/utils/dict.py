@@ -121,15 +121,15 @@ def dict_merge(dct, merge_dct, add_keys=True,
     # remove all entries marked as exclusions from dct
     for k in exclusions:
         if (k in dct) and (exclusions[k] is True):
-            logger.debug("Key '{}' excluded from dct.".format(k))
+            logger.debug("Key '%s' excluded from dct.", k)
             del dct[k]
 
     if not add_keys:
         merge_dct = {
             k: merge_dct[k] for k in set(dct).intersection(set(merge_dct))}
         logger.debug(
-            "Not merging keys only in 'merge_dict', only merging {}.".format(
-                merge_dct.keys()))
+            "Not merging keys only in 'merge_dict', only merging %s.",
+            merge_dct.keys())
 
     # Add empty fields to merge_dct for all keys in dct but not in merge_dct.
     # This makes sure the union of all keys from dct stripped off exclusions
@@ -145,32 +145,32 @@ def dict_merge(dct, merge_dct, add_keys=True,
         # is excluded
         if k in exclusions:
             lower_level_exclusions = exclusions[k]
-            logger.debug("Key '{}' included in dct, but exclusions exist for nested keys.".format(k))
+            logger.debug("Key '%s' included in dct, but exclusions exist for nested keys.", k)
         else:
             lower_level_exclusions = {}
-            logger.debug("Key '{}' included in dct.".format(k))
+            logger.debug("Key '%s' included in dct.", k)
 
         # only treat nested nested dicts for now
         # TODO: treat also nested lists
         if (k in dct and isinstance(dct[k], dict)
                 and isinstance(v, collections.Mapping)):
             if k not in merge_exclusions:  # no exception rule for this field
-                logger.debug("Key '{}' included in merge.".format(k))
+                logger.debug("Key '%s' included in merge.", k)
                 dct[k] = dict_merge(dct[k], v, add_keys=add_keys,
                                     exclusions=lower_level_exclusions)
             elif merge_exclusions[k] is not True:  # exclusion rule for nested fields
-                logger.debug("Key '{}' included in merge, but exclusions exist for nested keys.".format(k))
+                logger.debug("Key '%s' included in merge, but exclusions exist for nested keys.", k)
                 dct[k] = dict_merge(dct[k], v, add_keys=add_keys,
                                     exclusions=lower_level_exclusions,
                                     merge_exclusions=merge_exclusions[k])
             else:
-                logger.debug("Key '{}' excluded from merge.".format(k))
+                logger.debug("Key '%s' excluded from merge.", k)
         else:
             if k not in merge_exclusions:  # no exception rule for this field
-                logger.debug("Key '{}' included in merge.".format(k))
+                logger.debug("Key '%s' included in merge.", k)
                 dct[k] = v
             else:
-                logger.debug("Key '{}' excluded from merge.".format(k))
+                logger.debug("Key '%s' excluded from merge.", k)
 
     return dct
 
@@ -190,28 +190,28 @@ def _compare(source, target, marker):
     if isinstance(marker, dict):
         for k, v in marker.items():
             if k not in source:
-                logger.error("{} not in source '{}'.".format(k, source))
+                logger.error("%s not in source '%s'.", k, source)
                 return False
             if k not in target:
-                logger.error("{} not in target '{}'.".format(k, source))
+                logger.error("%s not in target '%s'.", k, source)
                 return False
 
-            logger.debug("Descending into sub-tree '{}' of '{}'.".format(
-                source[k], source))
+            logger.debug("Descending into sub-tree '%s' of '%s'.",
+                         source[k], source)
             # descend
             if not _compare(source[k], target[k], v):
                 return False  # one failed comparison suffices
 
     elif isinstance(marker, list):  # source, target and marker must have same length
-        logger.debug("Branching into element wise sub-trees of '{}'.".format(
-            source))
+        logger.debug("Branching into element wise sub-trees of '%s'.",
+                     source)
         for s, t, m in zip(source, target, marker):
             if not _compare(s, t, m):
                 return False  # one failed comparison suffices
     else:  # arrived at leaf, comparison desired?
         if marker is not False:  # yes
-            logger.debug("Comparing '{}' == '{}' -> {}.".format(
-                source, target, source == target))
+            logger.debug("Comparing '%s' == '%s' -> %s.",
+                         source, target, source == target)
             return source == target
 
     # comparison either not desired or successfull for all elements
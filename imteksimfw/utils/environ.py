@@ -46,7 +46,7 @@ class TemporaryOSEnviron:
 
         if self._insertions:
             for k, v in self._insertions.items():
-                logger.debug("Inject env var '{}' = '{}'".format(k, v))
+                logger.debug("Inject env var '%s' = '%s'", k, v)
                 os.environ[k] = str(v)
 
         logger.debug("Initial modified os.environ:")
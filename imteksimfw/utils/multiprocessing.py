@@ -29,6 +29,9 @@ from typing import List
 
 
 import multiprocessing  # run task as child process to avoid side effects
+import multiprocessing.connection
+import os
+import signal
 import traceback  # forward exception from child process to parent process
 
 from fireworks.core.firework import FiretaskBase, FWAction
@@ -109,29 +112,45 @@ class RunAsChildProcessTask(FiretaskBase):
 
         p.start()
 
-        # wait for child to queue fw_action object and
-        # check whether child raises exception
-        while q.empty():
-            # if child raises exception, then it has terminated
-            # before queueing any fw_action object
-            if p.exception:
-                error, p_traceback = p.exception
-                raise ChildProcessError(p_traceback)
-
+        # resolve the optional stop event once up front instead of
+        # probing attributes on every iteration of the wait loop below
+        stop_event = getattr(self, '_stop_event', None)
+        if not hasattr(stop_event, 'is_set'):
+            stop_event = None
+
+        # block on the queue's pipe, the child's exception pipe and the
+        # process sentinel instead of busy-polling the queue, waking
+        # periodically to forward the stop signal; one of them becomes
+        # readable as soon as the child has queued its fw_action, raised
+        # or died
+        while not multiprocessing.connection.wait(
+                [q._reader, p._parent_conn, p.sentinel], timeout=0.1):
             # let child process stop
-            if hasattr(self, '_stop_event') and hasattr(self._stop_event, 'is_set'):
-                if self._stop_event.is_set():
-                    e.set()
+            if stop_event is not None and stop_event.is_set():
+                e.set()
 
-        # this loop will deadlock for any child that never raises
-        # an exception and does not queue anything
+        # if child raises exception, then it has terminated
+        # before queueing any fw_action object
+        if p.exception:
+            error, p_traceback = p.exception
+            raise ChildProcessError(p_traceback)
 
         # queue only used for one transfer of
         # return fw_action, should thus never deadlock.
         fw_action = q.get()
-        # if we reach this line without the child
-        # queueing anything, then process will deadlock.
-        p.join()
+        # the result has been delivered at this point: don't hang
+        # forever on a lingering child (i.e. a stuck non-daemon thread),
+        # escalate from plain join via SIGTERM to SIGKILL with bounded
+        # waits so the child is really gone when this method returns
+        p.join(5)
+        if p.is_alive():
+            p.terminate()
+            p.join(5)
+        if p.is_alive():
+            # Process.kill() only exists since Python 3.7, but this
+            # package still declares support for 3.6.5
+            os.kill(p.pid, signal.SIGKILL)
+            p.join()
         return fw_action
 
     def set_stop_event(self, e):
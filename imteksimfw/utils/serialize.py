@@ -76,13 +76,13 @@ def serialize_module_obj(obj):
     """Serialize all objects within module of 'obj' along with 'obj'."""
     logger = logging.getLogger(__name__)
     module = inspect.getmodule(obj)
-    logger.info("{:s} belongs to {:s}".format(obj.__name__, module.__name__))
+    logger.info("%s belongs to %s", obj.__name__, module.__name__)
 
     # list of 'name', 'object' tuples
     member_list = get_module_member_list(module)
     member_dict = dict(member_list)
-    logger.info("{} in same module as {:s}".format(
-        list(member_dict.keys()), obj.__name__))
+    logger.info("%s in same module as %s",
+                list(member_dict.keys()), obj.__name__)
 
     # a hack in order to get dill to serialize other objects within same module
     # as 'obj' as well if 'obj' depends on them.
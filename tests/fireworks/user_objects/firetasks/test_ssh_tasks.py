@@ -20,6 +20,9 @@ __date__ = 'May 7, 2020'
 import logging
 import unittest
 import os
+import selectors
+import socket
+import struct
 import tempfile
 import threading
 import time
@@ -27,7 +30,8 @@ import mockssh
 
 # needs dtool cli for verification
 
-from imteksimfw.fireworks.user_objects.firetasks.ssh_tasks import SSHForwardTask
+from imteksimfw.fireworks.user_objects.firetasks.ssh_tasks import (
+    SSHForwardTask, ForwardServer)
 
 module_dir = os.path.abspath(os.path.dirname(__file__))
 
@@ -80,5 +84,175 @@ class SSHTasksTest(unittest.TestCase):
             logger.info("Thread ended.")
 
 
+class StubTransport:
+    """Stand-in for a paramiko Transport.
+
+    The mock ssh server prohibits direct-tcpip channels, so open plain
+    sockets to the destination instead; the relay treats both alike."""
+
+    def open_channel(self, kind, dest_addr, src_addr):
+        return socket.create_connection(dest_addr)
+
+
+class ForwardServerTest(unittest.TestCase):
+    def setUp(self):
+        # local upper-case echo server stands in for the remote end
+        self._echo = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._echo.bind(('localhost', 0))
+        self._echo.listen(5)
+        self.echo_port = self._echo.getsockname()[1]
+        threading.Thread(target=self._echo_accept_loop, daemon=True).start()
+
+    def tearDown(self):
+        self._echo.close()
+
+    def _echo_accept_loop(self):
+        while True:
+            try:
+                connection, _ = self._echo.accept()
+            except OSError:
+                return
+            threading.Thread(
+                target=self._echo_serve, args=(connection,),
+                daemon=True).start()
+
+    @staticmethod
+    def _echo_serve(connection):
+        while True:
+            data = connection.recv(1024)
+            if not data:
+                break
+            if data.startswith(b'reset'):
+                # hard reset: answer with RST instead of a clean FIN
+                connection.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER,
+                    struct.pack('ii', 1, 0))
+                connection.close()
+                return
+            connection.sendall(data.upper())
+        connection.close()
+
+    def _serve(self, server):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def _wait_for_pair_count(self, server, count, timeout=5):
+        deadline = time.time() + timeout
+        # two entries per connection: socket -> channel and channel -> socket
+        while len(server._counterpart) != 2*count and time.time() < deadline:
+            time.sleep(0.1)
+        self.assertEqual(len(server._counterpart), 2*count)
+
+    def test_concurrent_connections(self):
+        """Relay two concurrent connections, then close one of them."""
+        with ForwardServer(('', 0), StubTransport(),
+                           'localhost', self.echo_port) as server:
+            thread = self._serve(server)
+            local_port = server.server_address[1]
+
+            first = socket.create_connection(('localhost', local_port))
+            second = socket.create_connection(('localhost', local_port))
+
+            # both connections relay independently through one server
+            first.sendall(b'first')
+            second.sendall(b'second')
+            self.assertEqual(first.recv(1024), b'FIRST')
+            self.assertEqual(second.recv(1024), b'SECOND')
+            self._wait_for_pair_count(server, 2)
+
+            # closing one connection must tear down its pair only ...
+            first.close()
+            self._wait_for_pair_count(server, 1)
+
+            # ... and leave the other fully functional
+            second.sendall(b'still forwarding')
+            self.assertEqual(second.recv(1024), b'STILL FORWARDING')
+
+            second.close()
+            self._wait_for_pair_count(server, 0)
+
+            server.shutdown()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_relay_survives_connection_reset(self):
+        """A reset on one tunnel connection must not affect the others."""
+        with ForwardServer(('', 0), StubTransport(),
+                           'localhost', self.echo_port) as server:
+            thread = self._serve(server)
+            local_port = server.server_address[1]
+
+            doomed = socket.create_connection(('localhost', local_port))
+            healthy = socket.create_connection(('localhost', local_port))
+            self._wait_for_pair_count(server, 2)
+
+            healthy.sendall(b'ping')
+            self.assertEqual(healthy.recv(1024), b'PING')
+
+            # make the echo server reset its end of the doomed connection
+            # and keep data in flight towards it from this end
+            doomed.sendall(b'reset')
+            deadline = time.time() + 5
+            while len(server._counterpart) > 2 and time.time() < deadline:
+                try:
+                    doomed.sendall(b'data in flight')
+                except OSError:
+                    pass
+                time.sleep(0.1)
+            self._wait_for_pair_count(server, 1)
+
+            # the relay loop survived and still serves the other connection
+            self.assertTrue(thread.is_alive())
+            healthy.sendall(b'still forwarding')
+            self.assertEqual(healthy.recv(1024), b'STILL FORWARDING')
+
+            doomed.close()
+            healthy.close()
+            self._wait_for_pair_count(server, 0)
+
+            server.shutdown()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_relay_send_failure_closes_pair(self):
+        """A failing send must tear down only the affected pair."""
+        with ForwardServer(('', 0), StubTransport(),
+                           'localhost', self.echo_port) as server:
+            source, feeder = socket.socketpair()
+            counterpart, peer = socket.socketpair()
+            server._counterpart[source] = counterpart
+            server._counterpart[counterpart] = source
+            server._peername[source] = ('broken', 0)
+            server._selector.register(source, selectors.EVENT_READ)
+            server._selector.register(counterpart, selectors.EVENT_READ)
+
+            peer.close()  # sending to counterpart now raises EPIPE
+            feeder.sendall(b'data in flight')
+            server._relay(source)  # must swallow the error ...
+
+            # ... and tear down the pair
+            self.assertEqual(len(server._counterpart), 0)
+            feeder.close()
+
+    def test_server_close_with_live_connection(self):
+        """server_close must tear down connections still in flight."""
+        server = ForwardServer(('', 0), StubTransport(),
+                               'localhost', self.echo_port)
+        with server:
+            thread = self._serve(server)
+            connection = socket.create_connection(
+                ('localhost', server.server_address[1]))
+            connection.sendall(b'ping')
+            self.assertEqual(connection.recv(1024), b'PING')
+            self._wait_for_pair_count(server, 1)
+            server.shutdown()
+            thread.join(5)
+        # leaving the context closed the server with the pair still live
+        self.assertEqual(len(server._counterpart), 0)
+        self.assertEqual(connection.recv(1024), b'')
+        connection.close()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,39 @@
+# coding: utf-8
+"""Test child process handling of RunAsChildProcessTask."""
+__author__ = 'Johannes Laurin Hoermann'
+__copyright__ = 'Copyright 2020, IMTEK Simulation, University of Freiburg'
+__email__ = 'johannes.hoermann@imtek.uni-freiburg.de, johannes.laurin@gmail.com'
+
+import time
+import unittest
+
+from fireworks.core.firework import FWAction
+
+from imteksimfw.utils.multiprocessing import RunAsChildProcessTask
+
+
+class LingeringChildTask(RunAsChildProcessTask):
+    """Queues its result, then refuses to exit."""
+    _fw_name = 'LingeringChildTask'
+
+    def _run_task_as_child_process(self, fw_spec, q, e=None):
+        q.put(FWAction())
+        # emulate a stuck non-daemon thread keeping the child alive
+        time.sleep(600)
+
+
+class RunAsChildProcessTaskTest(unittest.TestCase):
+    def test_lingering_child_is_reaped(self):
+        """run_task must return once the result arrived, reaping the child."""
+        t = LingeringChildTask()
+        start = time.time()
+        fw_action = t.run_task({})
+        elapsed = time.time() - start
+        self.assertIsInstance(fw_action, FWAction)
+        # the bounded join(5) / terminate / kill escalation must end the
+        # child in seconds, way below the 600 s it would linger otherwise
+        self.assertLess(elapsed, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()